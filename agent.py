@@ -1,11 +1,16 @@
+import atexit
 import logging
+import logging.handlers
 import os
-import json
 import sys
-import re
 import asyncio
-import csv
 import time
+import functools
+import queue
+import random
+import urllib.parse
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
 
 # Prefer project-local virtualenv packages even when invoked as `python ...`.
 _PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -13,35 +18,184 @@ _VENV_SITE_PACKAGES = os.path.join(_PROJECT_ROOT, ".venv", "Lib", "site-packages
 if os.path.isdir(_VENV_SITE_PACKAGES) and _VENV_SITE_PACKAGES not in sys.path:
     sys.path.insert(0, _VENV_SITE_PACKAGES)
 
-from dotenv import load_dotenv
+# Load environment variables with local override support.
+import env_boot  # noqa: F401
 
+import orjson
 from livekit import agents, api
-from livekit.agents import AgentSession, Agent, inference
+from livekit.agents import AgentSession, Agent, ChatContext, SpeechHandle, inference
 from livekit.plugins import openai
 from personal_stt import build_personal_stt
 from personal_tts import build_personal_tts
+from utils import DEFAULT_PHONE_REGION, digits_only, iter_csv_rows, to_e164
+
+
+def _configure_logging(level: int = logging.INFO) -> None:
+    """
+    Like logging.basicConfig, but records go through a queue and are written by a
+    QueueListener thread, so a slow stdout/pipe never blocks the event loop.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)
 
-# Load environment variables with local override support.
-load_dotenv(".env.local")
-load_dotenv(".env")
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+_configure_logging()
 logger = logging.getLogger("outbound-agent")
 
+T = TypeVar("T")
+
 
-# TRUNK ID - This needs to be set after you crate your trunk
-# You can find this by running 'python setup_trunk.py --list' or checking LiveKit Dashboard
-OUTBOUND_TRUNK_ID = os.getenv("OUTBOUND_TRUNK_ID")
-SIP_DOMAIN = os.getenv("VOBIZ_SIP_DOMAIN") 
 DEFAULT_PRO_GREETING = (
     "Namaste. Main AdvisorMax se bol raha hoon. "
     "Aap kis shehar ya location mein zameen kharidna chahte hain?"
 )
 DEFAULT_PROPERTY_CSV_PATH = r"c:\Users\tshiv\Downloads\pan_india_property_listings_2025.csv"
+# Characters allowed unescaped in a SIP URI user part; "%" keeps pre-encoded values intact.
+_SIP_USER_SAFE_CHARS = "-_.!~*'()&=+$,;?/%"
+# Backoff between _safe_say/_safe_generate_reply attempts (seconds).
+_RETRY_BACKOFF_BASE = 0.2
+_RETRY_BACKOFF_CAP = 2.0
+_RETRY_BACKOFF_JITTER = 0.5
+_PROPERTY_BRIEF_COLUMNS = (
+    "city",
+    "locality",
+    "bhk",
+    "property_type",
+    "area_sqft",
+    "price",
+    "sale_rent",
+    "amenities",
+)
+
+
+def _quote_sip_user(userinfo: str) -> str:
+    """
+    Percent-encode the userinfo part of a SIP URI (RFC 3261 section 25.1).
+    The user and optional password are encoded separately so the ":" between them survives.
+    """
+    user, sep, password = userinfo.partition(":")
+    quoted = urllib.parse.quote(user, safe=_SIP_USER_SAFE_CHARS)
+    if sep:
+        quoted += sep + urllib.parse.quote(password, safe=_SIP_USER_SAFE_CHARS)
+    return quoted
+
+
+def _format_transfer_destination(destination: str, sip_domain: str = "") -> str:
+    scheme = "sips:" if destination.startswith("sips:") else "sip:"
+    if "@" not in destination:
+        if sip_domain:
+            clean_dest = destination.removeprefix(scheme).removeprefix("tel:")
+            return f"{scheme}{_quote_sip_user(clean_dest)}@{sip_domain}"
+        if not destination.startswith(("tel:", "sip:", "sips:")):
+            return f"tel:{destination}"
+        return destination
+    user, _, host = destination.removeprefix(scheme).rpartition("@")
+    return f"{scheme}{_quote_sip_user(user)}@{host}"
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """Environment snapshot taken once per worker process; parsed values are typed."""
+
+    llm_provider: str
+    tts_provider: str
+    stt_profile: str
+    # TRUNK ID - This needs to be set after you crate your trunk
+    # You can find this by running 'python setup_trunk.py --list' or checking LiveKit Dashboard
+    outbound_trunk_id: str
+    sip_domain: str
+    enable_outbound_calls: bool
+    auto_transfer_on_failure: bool
+    silence_transfer_seconds: int
+    default_transfer_number: str
+    # SIP/tel URI for DEFAULT_TRANSFER_NUMBER, precomputed for the failure path.
+    transfer_uri: str
+    phone_region: str
+    outbound_greeting: str
+    llm_temperature: float
+    llm_max_tokens: int
+    livekit_llm_model: str
+    gemini_model: str
+    gemini_api_key: str
+    gemini_base_url: str
+    openai_llm_model: str
+    openai_api_key: str
+    cartesia_api_key: str
+    property_csv_path: str
+
+    @classmethod
+    def from_env(cls) -> "RuntimeConfig":
+        sip_domain = os.getenv("VOBIZ_SIP_DOMAIN", "")
+        phone_region = os.getenv("DEFAULT_PHONE_REGION", DEFAULT_PHONE_REGION).upper()
+        default_transfer_number = os.getenv("DEFAULT_TRANSFER_NUMBER", "").strip()
+        if (
+            default_transfer_number
+            and "@" not in default_transfer_number
+            and not default_transfer_number.startswith(("tel:", "sip:", "sips:"))
+        ):
+            # A bare phone number: validate it now rather than on the failure path.
+            try:
+                default_transfer_number = to_e164(default_transfer_number, phone_region)
+            except ValueError as e:
+                raise RuntimeError(f"Invalid DEFAULT_TRANSFER_NUMBER: {e}") from e
+        return cls(
+            llm_provider=sys.intern(os.getenv("LLM_PROVIDER", "livekit").lower()),
+            tts_provider=sys.intern(os.getenv("TTS_PROVIDER", "openai").lower()),
+            stt_profile=sys.intern(os.getenv("PERSONAL_STT_PROFILE", "balanced").lower()),
+            outbound_trunk_id=os.getenv("OUTBOUND_TRUNK_ID", ""),
+            sip_domain=sip_domain,
+            enable_outbound_calls=os.getenv("ENABLE_OUTBOUND_CALLS", "false").lower() == "true",
+            auto_transfer_on_failure=os.getenv("AUTO_TRANSFER_ON_FAILURE", "true").lower() == "true",
+            silence_transfer_seconds=int(os.getenv("SILENCE_TRANSFER_SECONDS", "60")),
+            default_transfer_number=default_transfer_number,
+            transfer_uri=(
+                _format_transfer_destination(default_transfer_number, sip_domain)
+                if default_transfer_number
+                else ""
+            ),
+            phone_region=phone_region,
+            outbound_greeting=os.getenv("OUTBOUND_GREETING", DEFAULT_PRO_GREETING),
+            llm_temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.2")),
+            llm_max_tokens=int(os.getenv("OPENAI_MAX_TOKENS", "180")),
+            livekit_llm_model=os.getenv("LIVEKIT_INFERENCE_LLM_MODEL", "openai/gpt-4o-mini"),
+            gemini_model=os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
+            gemini_api_key=os.getenv("GEMINI_API_KEY", ""),
+            gemini_base_url=os.getenv(
+                "GEMINI_BASE_URL",
+                "https://generativelanguage.googleapis.com/v1beta/openai/",
+            ),
+            openai_llm_model=os.getenv("OPENAI_LLM_MODEL", "gpt-4o-mini"),
+            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+            cartesia_api_key=os.getenv("CARTESIA_API_KEY", ""),
+            property_csv_path=os.getenv("PROPERTY_CSV_PATH", DEFAULT_PROPERTY_CSV_PATH),
+        )
+
+
+# Snapshot of the environment, parsed once at import; see reload_config().
+CONFIG = RuntimeConfig.from_env()
+
 
+def reload_config() -> RuntimeConfig:
+    """Re-read the environment into CONFIG (e.g. from a SIGHUP handler)."""
+    global CONFIG
+    CONFIG = RuntimeConfig.from_env()
+    _validate_runtime_config.cache_clear()
+    return CONFIG
 
-def _validate_runtime_config() -> None:
+
+@functools.lru_cache(maxsize=1)
+def _validate_runtime_config() -> RuntimeConfig:
+    """Validate required settings and return the runtime config snapshot."""
     required_common = [
         "LIVEKIT_URL",
         "LIVEKIT_API_KEY",
@@ -50,22 +204,23 @@ def _validate_runtime_config() -> None:
     ]
     missing = [k for k in required_common if not os.getenv(k)]
 
-    llm_provider = os.getenv("LLM_PROVIDER", "livekit").lower()
-    tts_provider = os.getenv("TTS_PROVIDER", "openai").lower()
+    config = CONFIG
+    llm_provider = config.llm_provider
+    tts_provider = config.tts_provider
 
-    if llm_provider == "gemini" and not os.getenv("GEMINI_API_KEY"):
+    if llm_provider == "gemini" and not config.gemini_api_key:
         missing.append("GEMINI_API_KEY")
-    elif llm_provider == "openai" and not os.getenv("OPENAI_API_KEY"):
+    elif llm_provider == "openai" and not config.openai_api_key:
         missing.append("OPENAI_API_KEY")
     elif llm_provider == "livekit":
         # Uses LiveKit API key/secret from required_common.
         pass
 
-    if tts_provider == "cartesia" and not os.getenv("CARTESIA_API_KEY"):
+    if tts_provider == "cartesia" and not config.cartesia_api_key:
         missing.append("CARTESIA_API_KEY")
-    elif tts_provider == "openai" and not os.getenv("OPENAI_API_KEY"):
+    elif tts_provider == "openai" and not config.openai_api_key:
         missing.append("OPENAI_API_KEY")
-    elif tts_provider == "gemini" and not os.getenv("GEMINI_API_KEY"):
+    elif tts_provider == "gemini" and not config.gemini_api_key:
         missing.append("GEMINI_API_KEY")
     elif tts_provider == "livekit":
         # Uses LiveKit API key/secret from required_common.
@@ -75,82 +230,99 @@ def _validate_runtime_config() -> None:
     missing = list(dict.fromkeys(missing))
     if missing:
         raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+    return config
 
 
-def _normalize_phone_number(phone_number: str) -> str:
-    """Normalize user-provided phone input to E.164-like +<digits>."""
-    digits = re.sub(r"\D", "", phone_number or "")
-    if not digits:
+def _normalize_phone_number(phone_number: str, region: str = DEFAULT_PHONE_REGION) -> str:
+    """Normalize user-provided phone input to E.164; raises ValueError if it is not dialable."""
+    if not digits_only(phone_number or ""):
         return ""
-    return f"+{digits}"
+    return to_e164(phone_number, region)
 
 
 def _participant_identity_for_phone(phone_number: str) -> str:
     """Build a LiveKit-safe participant identity from phone number digits."""
-    digits = re.sub(r"\D", "", phone_number or "")
+    digits = digits_only(phone_number or "")
     return f"sip_{digits}" if digits else "sip_unknown"
 
 
-def _build_llm():
-    """Configure a fast default LLM for conversational turns."""
-    provider = os.getenv("LLM_PROVIDER", "livekit").lower()
-    temperature = float(os.getenv("OPENAI_TEMPERATURE", "0.2"))
-    max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", "180"))
-
-    if provider == "livekit":
-        logger.info("Using LiveKit Inference LLM")
-        return inference.LLM(
-            model=os.getenv("LIVEKIT_INFERENCE_LLM_MODEL", "openai/gpt-4o-mini"),
-            extra_kwargs={
-                "temperature": temperature,
-                "max_completion_tokens": max_tokens,
-            },
-        )
+def _build_livekit_llm(config: RuntimeConfig):
+    logger.info("Using LiveKit Inference LLM")
+    return inference.LLM(
+        model=config.livekit_llm_model,
+        extra_kwargs={
+            "temperature": config.llm_temperature,
+            "max_completion_tokens": config.llm_max_tokens,
+        },
+    )
+
+
+def _build_gemini_llm(config: RuntimeConfig):
+    logger.info("Using Gemini LLM")
+    return openai.LLM(
+        model=config.gemini_model,
+        api_key=config.gemini_api_key,
+        base_url=config.gemini_base_url,
+        temperature=config.llm_temperature,
+        max_completion_tokens=config.llm_max_tokens,
+    )
 
-    if provider == "gemini":
-        logger.info("Using Gemini LLM")
-        return openai.LLM(
-            model=os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
-            api_key=os.getenv("GEMINI_API_KEY"),
-            base_url=os.getenv(
-                "GEMINI_BASE_URL",
-                "https://generativelanguage.googleapis.com/v1beta/openai/",
-            ),
-            temperature=temperature,
-            max_completion_tokens=max_tokens,
-        )
 
+def _build_openai_llm(config: RuntimeConfig):
     logger.info("Using OpenAI LLM")
     return openai.LLM(
-        model=os.getenv("OPENAI_LLM_MODEL", "gpt-4o-mini"),
-        api_key=os.getenv("OPENAI_API_KEY"),
-        temperature=temperature,
-        max_completion_tokens=max_tokens,
+        model=config.openai_llm_model,
+        api_key=config.openai_api_key,
+        temperature=config.llm_temperature,
+        max_completion_tokens=config.llm_max_tokens,
     )
 
 
+_LLM_BUILDERS = {
+    "livekit": _build_livekit_llm,
+    "gemini": _build_gemini_llm,
+    "openai": _build_openai_llm,
+}
+
+
+def _build_llm(config: RuntimeConfig):
+    """Configure a fast default LLM for conversational turns."""
+    return _LLM_BUILDERS.get(config.llm_provider, _build_openai_llm)(config)
+
+
 def _load_property_brief(max_rows: int = 8) -> str:
     """
     Load a short property brief from CSV for real-estate conversations.
     Safe fallback: returns empty string on any read/parse error.
     """
-    csv_path = os.getenv("PROPERTY_CSV_PATH", DEFAULT_PROPERTY_CSV_PATH)
-    if not os.path.exists(csv_path):
+    csv_path = CONFIG.property_csv_path
+    try:
+        mtime = os.path.getmtime(csv_path)
+    except OSError:
         return ""
+    return _read_property_brief(csv_path, mtime, max_rows)
+
 
+@functools.lru_cache(maxsize=4)
+def _read_property_brief(csv_path: str, mtime: float, max_rows: int) -> str:
+    """Parse the CSV brief; `mtime` is part of the cache key so edits invalidate it."""
     lines = []
     try:
-        with open(csv_path, mode="r", encoding="utf-8-sig", newline="") as f:
-            reader = csv.DictReader(f)
-            for i, row in enumerate(reader):
-                if i >= max_rows:
-                    break
-                lines.append(
-                    f"- {row.get('city','')}, {row.get('locality','')}: "
-                    f"{row.get('bhk','')} BHK {row.get('property_type','')} "
-                    f"{row.get('area_sqft','')} sqft, price {row.get('price','')}, "
-                    f"{row.get('sale_rent','')}, amenities: {row.get('amenities','')}"
-                )
+        rows = iter_csv_rows(csv_path, max_rows)
+        header = next(rows, None)
+        if not header:
+            return ""
+        idx = {name: i for i, name in enumerate(header)}
+        cols = [idx.get(name) for name in _PROPERTY_BRIEF_COLUMNS]
+        for row in rows:
+            width = len(row)
+            city, locality, bhk, ptype, area, price, sale_rent, amenities = (
+                row[i] if i is not None and i < width else "" for i in cols
+            )
+            lines.append(
+                f"- {city}, {locality}: {bhk} BHK {ptype} {area} sqft, "
+                f"price {price}, {sale_rent}, amenities: {amenities}"
+            )
     except Exception:
         return ""
 
@@ -159,71 +331,146 @@ def _load_property_brief(max_rows: int = 8) -> str:
     return "Available property sample:\n" + "\n".join(lines)
 
 
-async def _safe_say(session: AgentSession, text: str, timeout: float = 20.0, retries: int = 2) -> bool:
-    """Speak text with retry/timeout so call flow does not stall on transient TTS issues."""
-    for attempt in range(1, retries + 1):
+async def _retry(
+    op: Callable[[], Awaitable[T]],
+    *,
+    label: str,
+    timeout: float,
+    retries: int,
+    total_timeout: float | None = None,
+    on_failure: Callable[[], None] | None = None,
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.5,
+) -> T | None:
+    """
+    Run `op` up to `retries` times, each attempt bounded by `timeout`.
+    All attempts and backoff sleeps share one `total_timeout` budget (default
+    `timeout * retries`). `on_failure` runs after a failed attempt, before any retry,
+    so callers can stop work the cancelled await left behind.
+    Waits with capped, jittered exponential backoff between attempts; ValueError and
+    RuntimeError are treated as unrecoverable. Returns None when every attempt fails.
+    """
+    loop = asyncio.get_running_loop()
+    if total_timeout is None:
+        total_timeout = timeout * retries
+    deadline = loop.time() + total_timeout
+    for attempt in range(retries):
         try:
-            logger.info(f"Greeting node: session.say start (attempt {attempt})")
-            await asyncio.wait_for(session.say(text), timeout=timeout)
-            logger.info("Greeting node: session.say completed")
-            return True
+            logger.info("%s start (attempt %d)", label, attempt + 1)
+            async with asyncio.timeout_at(min(deadline, loop.time() + timeout)):
+                result = await op()
+            logger.info("%s completed", label)
+            return result
+        except TimeoutError:
+            logger.error("%s timed out (attempt %d)", label, attempt + 1)
+        except (ValueError, RuntimeError) as e:
+            logger.error(
+                "%s failed with unrecoverable error (attempt %d): %s", label, attempt + 1, e
+            )
+            return None
         except Exception as e:
-            logger.error(f"Greeting TTS failed (attempt {attempt}): {e}")
-    return False
+            logger.error("%s failed (attempt %d): %s", label, attempt + 1, e)
+        if on_failure is not None:
+            on_failure()
+        if attempt + 1 < retries:
+            delay = min(cap, base * 2**attempt) * (1 + random.random() * jitter)
+            if loop.time() + delay >= deadline:
+                break
+            await asyncio.sleep(delay)
+    return None
+
+
+def _interrupt_speech(handle: SpeechHandle | None) -> None:
+    """Stop speech left playing by a timed-out await so a retry does not talk over it."""
+    if handle is None or handle.done():
+        return
+    try:
+        handle.interrupt()
+    except Exception as e:
+        logger.warning("Could not interrupt pending speech: %s", e)
+
+
+async def _safe_say(session: AgentSession, text: str, timeout: float = 20.0, retries: int = 2) -> bool:
+    """Speak text with retry/timeout so call flow does not stall on transient TTS issues."""
+    handle: SpeechHandle | None = None
+
+    async def say() -> bool:
+        nonlocal handle
+        handle = session.say(text)
+        await handle
+        return True
+
+    return bool(
+        await _retry(
+            say,
+            label="Greeting node: session.say",
+            timeout=timeout,
+            retries=retries,
+            on_failure=lambda: _interrupt_speech(handle),
+            base=_RETRY_BACKOFF_BASE,
+            cap=_RETRY_BACKOFF_CAP,
+            jitter=_RETRY_BACKOFF_JITTER,
+        )
+    )
 
 
 async def _safe_generate_reply(
     session: AgentSession, instructions: str, timeout: float = 20.0, retries: int = 2
 ) -> bool:
     """Generate LLM reply with retry/timeout so call keeps moving."""
-    for attempt in range(1, retries + 1):
-        try:
-            logger.info(f"LLM node: generate_reply start (attempt {attempt})")
-            await asyncio.wait_for(session.generate_reply(instructions=instructions), timeout=timeout)
-            logger.info("LLM node: generate_reply completed")
-            return True
-        except Exception as e:
-            logger.error(f"Initial LLM follow-up failed (attempt {attempt}): {e}")
-    return False
+    handle: SpeechHandle | None = None
 
+    async def generate_reply() -> bool:
+        nonlocal handle
+        handle = session.generate_reply(instructions=instructions)
+        await handle
+        return True
 
-def _format_transfer_destination(destination: str) -> str:
-    if "@" not in destination:
-        if SIP_DOMAIN:
-            clean_dest = destination.replace("tel:", "").replace("sip:", "")
-            return f"sip:{clean_dest}@{SIP_DOMAIN}"
-        if not destination.startswith("tel:") and not destination.startswith("sip:"):
-            return f"tel:{destination}"
-        return destination
-    if not destination.startswith("sip:"):
-        return f"sip:{destination}"
-    return destination
+    return bool(
+        await _retry(
+            generate_reply,
+            label="LLM node: generate_reply",
+            timeout=timeout,
+            retries=retries,
+            on_failure=lambda: _interrupt_speech(handle),
+            base=_RETRY_BACKOFF_BASE,
+            cap=_RETRY_BACKOFF_CAP,
+            jitter=_RETRY_BACKOFF_JITTER,
+        )
+    )
 
 
-async def _transfer_now(ctx: agents.JobContext, phone_number: str | None, reason: str) -> bool:
-    enabled = os.getenv("AUTO_TRANSFER_ON_FAILURE", "true").lower() == "true"
-    if not enabled:
-        logger.warning(f"Auto-transfer disabled. Reason={reason}")
+async def _transfer_now(
+    ctx: agents.JobContext, config: RuntimeConfig, participant_identity: str, reason: str
+) -> bool:
+    if not config.auto_transfer_on_failure:
+        logger.warning("Auto-transfer disabled. Reason=%s", reason)
         return False
 
-    destination = os.getenv("DEFAULT_TRANSFER_NUMBER", "").strip()
+    destination = config.transfer_uri
     if not destination:
         logger.error("Auto-transfer failed: DEFAULT_TRANSFER_NUMBER is missing.")
         return False
 
-    destination = _format_transfer_destination(destination)
-    participant_identity = _participant_identity_for_phone(phone_number or "")
-    if participant_identity == "sip_unknown":
-        for p in ctx.room.remote_participants.values():
-            participant_identity = p.identity
-            break
+    participants = ctx.room.remote_participants
+    if participant_identity not in participants:
+        # Fall back to whoever is in the room; keep the dialled identity if nobody is.
+        participant = next(iter(participants.values()), None)
+        if participant is not None:
+            participant_identity = participant.identity
+        elif participant_identity == "sip_unknown":
+            participant_identity = ""
     if not participant_identity:
         logger.error("Auto-transfer failed: participant identity not found.")
         return False
 
     try:
         logger.warning(
-            f"Auto-transfer triggered. Reason={reason}, participant={participant_identity}, destination={destination}"
+            "Auto-transfer triggered. Reason=%s, participant=%s, destination=%s",
+            reason,
+            participant_identity,
+            destination,
         )
         await ctx.api.sip.transfer_sip_participant(
             api.TransferSIPParticipantRequest(
@@ -235,38 +482,48 @@ async def _transfer_now(ctx: agents.JobContext, phone_number: str | None, reason
         )
         return True
     except Exception as e:
-        logger.error(f"Auto-transfer failed: {e}")
+        logger.error("Auto-transfer failed: %s", e)
         return False
 
 
+class CallActivity:
+    """Tracks the last successful agent turn and wakes the silence watchdog on updates."""
+
+    def __init__(self, participant_identity: str) -> None:
+        self.participant_identity = participant_identity
+        self.last_activity = time.monotonic()
+        self.bumped = asyncio.Event()
+
+    def bump(self) -> None:
+        self.last_activity = time.monotonic()
+        self.bumped.set()
+
+
 async def _silence_watchdog(
-    ctx: agents.JobContext, phone_number: str | None, activity: dict[str, float]
+    ctx: agents.JobContext,
+    config: RuntimeConfig,
+    activity: CallActivity,
 ) -> None:
-    threshold = int(os.getenv("SILENCE_TRANSFER_SECONDS", "60"))
+    threshold = config.silence_transfer_seconds
     while True:
-        await asyncio.sleep(5)
-        if time.monotonic() - activity["last_activity"] >= threshold:
-            await _transfer_now(ctx, phone_number, f"silence>{threshold}s")
+        remaining = threshold - (time.monotonic() - activity.last_activity)
+        if remaining <= 0:
+            await _transfer_now(
+                ctx, config, activity.participant_identity, f"silence>{threshold}s"
+            )
             return
+        # Sleep until the silence deadline unless activity is bumped first.
+        activity.bumped.clear()
+        # asyncio.timeout, unlike wait_for on 3.11, never swallows a cancellation
+        # that races with the event being set.
+        try:
+            async with asyncio.timeout(remaining):
+                await activity.bumped.wait()
+        except TimeoutError:
+            pass
 
 
-class OutboundAssistant(Agent):
-
-    """
-    An AI agent tailored for outbound calls.
-    Attempts to be helpful and concise.
-    """
-    def __init__(self, property_brief: str = "") -> None:
-        extra_catalog_rules = ""
-        if property_brief:
-            extra_catalog_rules = (
-                "\n6. Use the provided property catalog when discussing listings. "
-                "Do not invent property details.\n"
-                f"{property_brief}\n"
-            )
-
-        super().__init__(
-            instructions="""
+_BASE_INSTRUCTIONS: str = """
             You are AdvisorMax, an Indian real-estate AI calling agent.
             
             Key behaviors:
@@ -281,10 +538,49 @@ class OutboundAssistant(Agent):
                Urdu, Gujarati, Kannada, Malayalam, Punjabi, Odia, Assamese, or any other Indian language,
                immediately respond in that same language.
             9. If language is unclear, ask one short preference question and continue in the user's chosen language.
-            """ + extra_catalog_rules
+            """
+
+
+def _catalog_chat_ctx(property_brief: str) -> ChatContext | None:
+    """
+    Carry the per-call catalog as a chat message after the static instructions,
+    so the system prompt stays an identical, provider-cacheable prefix.
+    """
+    if not property_brief:
+        return None
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(
+        role="system",
+        content=(
+            "Use the provided property catalog when discussing listings. "
+            "Do not invent property details.\n"
+            f"{property_brief}"
+        ),
+    )
+    return chat_ctx
+
+
+class OutboundAssistant(Agent):
+
+    """
+    An AI agent tailored for outbound calls.
+    Attempts to be helpful and concise.
+    """
+    def __init__(self, property_brief: str = "") -> None:
+        super().__init__(
+            instructions=_BASE_INSTRUCTIONS,
+            chat_ctx=_catalog_chat_ctx(property_brief),
         )
 
 
+def prewarm(proc: agents.JobProcess) -> None:
+    """Build STT/LLM/TTS clients when the job process boots, ahead of the first dispatch."""
+    config = _validate_runtime_config()
+    proc.userdata["stt"] = build_personal_stt(config.stt_profile)
+    proc.userdata["llm"] = _build_llm(config)
+    proc.userdata["tts"] = build_personal_tts(logger, config.tts_provider)
+
+
 async def entrypoint(ctx: agents.JobContext):
     """
     Main entrypoint for the agent.
@@ -295,66 +591,78 @@ async def entrypoint(ctx: agents.JobContext):
     3. Initiates the SIP call to the phone number.
     4. Waits for answer before speaking.
     """
-    logger.info(f"Connecting to room: {ctx.room.name}")
-    _validate_runtime_config()
+    logger.info("Connecting to room: %s", ctx.room.name)
+    config = _validate_runtime_config()
     
     # parse the phone number from the metadata sent by the dispatch script
-    phone_number = None
+    raw_phone_number = ""
     try:
         if ctx.job.metadata:
-            data = json.loads(ctx.job.metadata)
-            phone_number = _normalize_phone_number(data.get("phone_number", ""))
+            data = orjson.loads(ctx.job.metadata)
+            raw_phone_number = str(data.get("phone_number") or "")
     except Exception:
         logger.warning("No valid JSON metadata found. This might be an inbound call.")
 
-    property_brief = _load_property_brief()
-    if property_brief:
-        logger.info("Loaded property catalog context from CSV.")
+    try:
+        phone_number = _normalize_phone_number(raw_phone_number, config.phone_region)
+    except ValueError as e:
+        logger.error("Rejecting outbound call: %s", e)
+        ctx.shutdown()
+        return
+
+    # Read the catalog in a worker thread while the session and its clients are built.
+    # run_in_executor submits immediately; a to_thread task would not start until the next await.
+    brief_future = asyncio.get_running_loop().run_in_executor(None, _load_property_brief)
 
     # Initialize the Agent Session with plugins
 
+    # Prefer the clients built in prewarm; each is used by one job only.
+    userdata = ctx.proc.userdata
     session = AgentSession(
-        stt=build_personal_stt(),
-        llm=_build_llm(),
-        tts=build_personal_tts(logger),
+        stt=userdata.pop("stt", None) or build_personal_stt(config.stt_profile),
+        llm=userdata.pop("llm", None) or _build_llm(config),
+        tts=userdata.pop("tts", None) or build_personal_tts(logger, config.tts_provider),
     )
 
+    property_brief = await brief_future
+    if property_brief:
+        logger.info("Loaded property catalog context from CSV.")
+
     # Start the session
     await session.start(room=ctx.room, agent=OutboundAssistant(property_brief=property_brief))
 
     if phone_number:
-        outbound_enabled = os.getenv("ENABLE_OUTBOUND_CALLS", "false").lower() == "true"
-        if not outbound_enabled:
+        if not config.enable_outbound_calls:
             logger.warning("Outbound calling is disabled by configuration. Skipping SIP dial.")
             return
 
-        if not OUTBOUND_TRUNK_ID:
+        if not config.outbound_trunk_id:
             logger.error("OUTBOUND_TRUNK_ID is missing. Set it in .env.local or .env.")
             ctx.shutdown()
             return
-        logger.info(f"Initiating outbound SIP call to {phone_number}...")
+        participant_identity = _participant_identity_for_phone(phone_number)
+        logger.info("Initiating outbound SIP call to %s...", phone_number)
         try:
             # Create a SIP participant to dial out
             # This effectively "calls" the phone number and brings them into this room
             await ctx.api.sip.create_sip_participant(
                 api.CreateSIPParticipantRequest(
                     room_name=ctx.room.name,
-                    sip_trunk_id=OUTBOUND_TRUNK_ID,
+                    sip_trunk_id=config.outbound_trunk_id,
                     sip_call_to=phone_number,
-                    participant_identity=_participant_identity_for_phone(phone_number),
+                    participant_identity=participant_identity,
                     wait_until_answered=True, # Important: Wait for pickup before continuing
                 )
             )
             logger.info("Call answered! Agent is now listening.")
-            activity = {"last_activity": time.monotonic()}
-            asyncio.create_task(_silence_watchdog(ctx, phone_number, activity))
+            activity = CallActivity(participant_identity)
+            asyncio.create_task(_silence_watchdog(ctx, config, activity))
             # Guaranteed greeting on pickup.
-            greeting = os.getenv("OUTBOUND_GREETING", DEFAULT_PRO_GREETING)
-            greeted = await _safe_say(session, greeting)
+            greeted = await _safe_say(session, config.outbound_greeting)
             if greeted:
-                activity["last_activity"] = time.monotonic()
+                activity.bump()
             else:
-                transferred = await _transfer_now(ctx, phone_number, "greeting_failed")
+                transferred = await _transfer_now(ctx, config, participant_identity, "greeting_failed")
                 if transferred:
                     return
 
@@ -368,18 +676,18 @@ async def entrypoint(ctx: agents.JobContext):
                 ),
             )
             if replied:
-                activity["last_activity"] = time.monotonic()
+                activity.bump()
             else:
-                transferred = await _transfer_now(ctx, phone_number, "llm_reply_failed")
+                transferred = await _transfer_now(ctx, config, participant_identity, "llm_reply_failed")
                 if transferred:
                     return
 
             # Hard fallback when model/TTS pipeline still fails.
             if not greeted and not replied:
-                await _transfer_now(ctx, phone_number, "both_greeting_and_reply_failed")
+                await _transfer_now(ctx, config, participant_identity, "both_greeting_and_reply_failed")
             
         except Exception as e:
-            logger.error(f"Failed to place outbound call: {e}")
+            logger.error("Failed to place outbound call: %s", e)
             # Ensure we clean up if the call fails
             ctx.shutdown()
     else:
@@ -395,6 +703,7 @@ if __name__ == "__main__":
     agents.cli.run_app(
         agents.WorkerOptions(
             entrypoint_fnc=entrypoint,
+            prewarm_fnc=prewarm,
             agent_name="outbound-caller",
             port=worker_port,
         )
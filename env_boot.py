@@ -0,0 +1,80 @@
+"""
+Load environment variables once per process.
+
+Importing this module applies `.env.local` and `.env` to `os.environ`
+(earlier files win, existing process variables are never overridden).
+Run `python env_boot.py` at deploy time to compile both files into
+`.env.json`, which is preferred whenever it is newer than the dotenv files.
+"""
+import functools
+import json
+import os
+
+from dotenv import dotenv_values
+from dotenv.variables import parse_variables
+
+# Earlier files take precedence, matching the previous load_dotenv order.
+ENV_FILES = (".env.local", ".env")
+ENV_JSON_PATH = ".env.json"
+
+
+def _mtime(path: str) -> float | None:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _parse_dotenv_files() -> dict[str, str]:
+    """
+    Merge ENV_FILES, resolving ${VAR} references as sequential load_dotenv calls did:
+    the process env wins, then values from earlier files, then earlier keys in the same file.
+    """
+    values: dict[str, str] = {}
+    for path in ENV_FILES:
+        file_values: dict[str, str] = {}
+        for key, raw in dotenv_values(path, interpolate=False).items():
+            if raw is None:
+                continue
+            env = {**file_values, **values, **os.environ}
+            file_values[key] = "".join(atom.resolve(env) for atom in parse_variables(raw))
+        for key, value in file_values.items():
+            values.setdefault(key, value)
+    return values
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_env_files() -> dict[str, str]:
+    """Parse env files without applying them; prefers a fresh `.env.json`."""
+    json_mtime = _mtime(ENV_JSON_PATH)
+    if json_mtime is not None:
+        source_mtimes = [m for m in map(_mtime, ENV_FILES) if m is not None]
+        if all(m <= json_mtime for m in source_mtimes):
+            try:
+                with open(ENV_JSON_PATH, encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+    return _parse_dotenv_files()
+
+
+def load_env() -> None:
+    """Apply parsed values for keys that are not already set in the process."""
+    for key, value in _parse_env_files().items():
+        os.environ.setdefault(key, str(value))
+
+
+def compile_env_json(path: str = ENV_JSON_PATH) -> int:
+    """Write the merged dotenv values to `path` and return the number of keys."""
+    values = _parse_dotenv_files()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(values, f, indent=2, sort_keys=True)
+    return len(values)
+
+
+load_env()
+
+
+if __name__ == "__main__":
+    count = compile_env_json()
+    print(f"Wrote {count} variables to {ENV_JSON_PATH}")
@@ -1,10 +1,10 @@
 import argparse
 import asyncio
+import csv
 import os
 import random
 import json
 import sys
-import re
 
 # Prefer project-local virtualenv packages even when invoked as `python ...`.
 _PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -12,50 +12,48 @@ _VENV_SITE_PACKAGES = os.path.join(_PROJECT_ROOT, ".venv", "Lib", "site-packages
 if os.path.isdir(_VENV_SITE_PACKAGES) and _VENV_SITE_PACKAGES not in sys.path:
     sys.path.insert(0, _VENV_SITE_PACKAGES)
 
-from dotenv import load_dotenv
+# Load environment variables with local override support.
+import env_boot  # noqa: F401
 from livekit import api
+from utils import DEFAULT_PHONE_REGION, iter_csv_rows, to_e164
 
-# Load environment variables with local override support.
-load_dotenv(".env.local")
-load_dotenv(".env")
+DEFAULT_BATCH_LIMIT = 50
 
-async def main():
-    outbound_enabled = os.getenv("ENABLE_OUTBOUND_CALLS", "false").lower() == "true"
-    if not outbound_enabled:
-        print("Outbound calling is disabled. Set ENABLE_OUTBOUND_CALLS=true to allow calls.")
-        return
 
-    parser = argparse.ArgumentParser(description="Make an outbound call via LiveKit Agent.")
-    parser.add_argument("--to", required=True, help="The phone number to call (e.g., +91...)")
-    args = parser.parse_args()
+def _normalize_phone_numbers(raw_numbers: list[str], region: str) -> list[str]:
+    """Format each number as E.164, reporting and skipping the ones that are invalid."""
+    phone_numbers = []
+    for raw in raw_numbers:
+        try:
+            phone_numbers.append(to_e164(raw.strip(), region))
+        except ValueError as e:
+            print(f"Skipping {raw!r}: {e}")
+    return phone_numbers
 
-    # 1. Validation
-    digits = re.sub(r"\D", "", args.to.strip())
-    phone_number = f"+{digits}" if digits else ""
-    if not phone_number:
-        print("Error: phone number is empty after normalization.")
-        return
 
-    url = os.getenv("LIVEKIT_URL")
-    api_key = os.getenv("LIVEKIT_API_KEY")
-    api_secret = os.getenv("LIVEKIT_API_SECRET")
-    trunk_id = os.getenv("OUTBOUND_TRUNK_ID")
-    sip_domain = os.getenv("VOBIZ_SIP_DOMAIN")
+def _read_batch_numbers(batch_file: str, limit: int) -> list[str]:
+    """Read up to `limit` numbers from the `phone_number` column (or first column) of a CSV."""
+    rows = list(iter_csv_rows(batch_file, limit))
+    if rows and "phone_number" in rows[0]:
+        col = rows[0].index("phone_number")
+        rows = rows[1:]
+    else:
+        # No header row: every line is a number.
+        col = 0
+        rows = rows[:limit]
+    return [row[col] for row in rows if len(row) > col]
 
-    if not (url and api_key and api_secret):
-        print("Error: LiveKit credentials missing in .env.local")
-        return
-    if not trunk_id:
-        print("Error: OUTBOUND_TRUNK_ID missing. Run setup and set it in .env.local/.env.")
-        return
-    if not sip_domain:
-        print("Error: VOBIZ_SIP_DOMAIN missing in .env.local/.env.")
-        return
 
-    # 2. Setup API Client
-    lk_api = api.LiveKitAPI(url=url, api_key=api_key, api_secret=api_secret)
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
-    # 3. Create a unique room for this call
+
+async def dial(lk_api: api.LiveKitAPI, phone_number: str) -> bool:
+    """Create a room for `phone_number` and dispatch the agent using an existing API client."""
+    # Create a unique room for this call
     # We use a random suffix to ensure room names are unique
     room_name = f"call-{phone_number.replace('+', '')}-{random.randint(1000, 9999)}"
 
@@ -81,7 +79,7 @@ async def main():
             else:
                 raise
 
-        # 4. Dispatch the Agent
+        # Dispatch the Agent
         # We explicitly tell LiveKit to send the 'outbound-caller' agent to this room.
         # We pass the phone number in the 'metadata' field so the agent knows who to dial.
         dispatch_request = api.CreateAgentDispatchRequest(
@@ -89,21 +87,89 @@ async def main():
             room=room_name,
             metadata=json.dumps({"phone_number": phone_number})
         )
-        
+
         dispatch = await lk_api.agent_dispatch.create_dispatch(dispatch_request)
 
-        print("\nCall dispatched successfully.")
+        print(f"\nCall to {phone_number} dispatched successfully.")
         print(f"Dispatch ID: {dispatch.id}")
         print(f"Agent Name: {dispatch.agent_name}")
         print("-" * 40)
-        print("The agent is now joining the room and will dial the number.")
-        print("Check your agent terminal for logs.")
-        
+        return True
+
     except Exception as e:
-        print(f"\nError dispatching call: {e}")
-    
+        print(f"\nError dispatching call to {phone_number}: {e}")
+        return False
+
+
+async def bulk_dial(numbers: list[str], url: str, api_key: str, api_secret: str) -> list[bool]:
+    """Dispatch calls to all `numbers` concurrently over a single LiveKit API client."""
+    lk_api = api.LiveKitAPI(url=url, api_key=api_key, api_secret=api_secret)
+    try:
+        return await asyncio.gather(*(dial(lk_api, n) for n in numbers))
     finally:
         await lk_api.aclose()
 
+
+async def main():
+    outbound_enabled = os.getenv("ENABLE_OUTBOUND_CALLS", "false").lower() == "true"
+    if not outbound_enabled:
+        print("Outbound calling is disabled. Set ENABLE_OUTBOUND_CALLS=true to allow calls.")
+        return
+
+    parser = argparse.ArgumentParser(description="Make an outbound call via LiveKit Agent.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--to", help="The phone number to call (e.g., +91...)")
+    target.add_argument(
+        "--batch-file",
+        help="CSV file of numbers to call (uses the 'phone_number' column, or the first column)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=_positive_int,
+        default=DEFAULT_BATCH_LIMIT,
+        help=f"Maximum numbers to read from --batch-file (default: {DEFAULT_BATCH_LIMIT})",
+    )
+    args = parser.parse_args()
+
+    # 1. Validation
+    if args.batch_file:
+        try:
+            raw_numbers = _read_batch_numbers(args.batch_file, args.limit)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            print(f"Error: could not read batch file: {e}")
+            return
+    else:
+        raw_numbers = [args.to]
+
+    region = os.getenv("DEFAULT_PHONE_REGION", DEFAULT_PHONE_REGION).upper()
+    phone_numbers = _normalize_phone_numbers(raw_numbers, region)
+    if not phone_numbers:
+        print("Error: no valid phone number to call.")
+        return
+
+    url = os.getenv("LIVEKIT_URL")
+    api_key = os.getenv("LIVEKIT_API_KEY")
+    api_secret = os.getenv("LIVEKIT_API_SECRET")
+    trunk_id = os.getenv("OUTBOUND_TRUNK_ID")
+    sip_domain = os.getenv("VOBIZ_SIP_DOMAIN")
+
+    if not (url and api_key and api_secret):
+        print("Error: LiveKit credentials missing in .env.local")
+        return
+    if not trunk_id:
+        print("Error: OUTBOUND_TRUNK_ID missing. Run setup and set it in .env.local/.env.")
+        return
+    if not sip_domain:
+        print("Error: VOBIZ_SIP_DOMAIN missing in .env.local/.env.")
+        return
+
+    # 2. Dispatch every call over one shared API client
+    results = await bulk_dial(phone_numbers, url, api_key, api_secret)
+    if any(results):
+        print("The agent is now joining the room and will dial the number.")
+        print("Check your agent terminal for logs.")
+    if len(results) > 1:
+        print(f"Dispatched {sum(results)}/{len(results)} calls.")
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,8 +1,15 @@
 import os
 from livekit.agents import inference
 
+# profile -> (default endpointing ms, punctuate, smart_format)
+_STT_PROFILES = {
+    "fast": (20, False, False),
+    "balanced": (25, False, False),
+    "accurate": (60, True, True),
+}
 
-def build_personal_stt():
+
+def build_personal_stt(profile: str | None = None):
     """
     Build a tuned STT instance using LiveKit Inference.
 
@@ -10,21 +17,18 @@ def build_personal_stt():
     - fast: lowest latency
     - balanced: good latency + stability
     - accurate: better punctuation/formatting, slightly slower
+
+    `profile` defaults to PERSONAL_STT_PROFILE; unknown profiles use balanced.
     """
-    profile = os.getenv("PERSONAL_STT_PROFILE", "balanced").lower()
+    if profile is None:
+        profile = os.getenv("PERSONAL_STT_PROFILE", "balanced").lower()
     model = os.getenv("LIVEKIT_INFERENCE_STT_MODEL", "deepgram/nova-3")
     language = os.getenv("LIVEKIT_INFERENCE_STT_LANGUAGE", "multi")
 
-    endpointing = int(os.getenv("LIVEKIT_INFERENCE_ENDPOINTING_MS", "25"))
-    punctuate = False
-    smart_format = False
-
-    if profile == "fast":
-        endpointing = int(os.getenv("LIVEKIT_INFERENCE_ENDPOINTING_MS", "20"))
-    elif profile == "accurate":
-        endpointing = int(os.getenv("LIVEKIT_INFERENCE_ENDPOINTING_MS", "60"))
-        punctuate = True
-        smart_format = True
+    default_endpointing, punctuate, smart_format = _STT_PROFILES.get(
+        profile, _STT_PROFILES["balanced"]
+    )
+    endpointing = int(os.getenv("LIVEKIT_INFERENCE_ENDPOINTING_MS", str(default_endpointing)))
 
     extra_kwargs = {
         "interim_results": True,
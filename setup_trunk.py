@@ -8,19 +8,14 @@ _VENV_SITE_PACKAGES = os.path.join(_PROJECT_ROOT, ".venv", "Lib", "site-packages
 if os.path.isdir(_VENV_SITE_PACKAGES) and _VENV_SITE_PACKAGES not in sys.path:
     sys.path.insert(0, _VENV_SITE_PACKAGES)
 
-from dotenv import load_dotenv
-from livekit import api
-
 # Load environment variables with local override support.
-load_dotenv(".env.local")
-load_dotenv(".env")
+import env_boot  # noqa: F401
+from livekit import api
 
-async def main():
-    # Initialize LiveKit API
-    # Credentials (LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET) are auto-loaded from .env
-    lkapi = api.LiveKitAPI()
+async def update_trunk(lkapi: api.LiveKitAPI) -> None:
+    """Push Vobiz trunk settings using an existing API client (caller owns its lifetime)."""
     sip = lkapi.sip
-    
+
     trunk_id = os.getenv("OUTBOUND_TRUNK_ID")
     address = os.getenv("VOBIZ_SIP_DOMAIN")
     username = os.getenv("VOBIZ_USERNAME")
@@ -50,6 +45,13 @@ async def main():
         
     except Exception as e:
         print(f"\nFailed to update trunk: {e}")
+
+async def main():
+    # Initialize LiveKit API
+    # Credentials (LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET) are auto-loaded from .env
+    lkapi = api.LiveKitAPI()
+    try:
+        await update_trunk(lkapi)
     finally:
         await lkapi.aclose()
 
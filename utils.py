@@ -0,0 +1,54 @@
+import csv
+import functools
+import io
+import itertools
+from typing import Iterator
+
+import phonenumbers
+
+
+class _AsciiDigitTable(dict):
+    """str.translate table that keeps ASCII digits and deletes every other character."""
+
+    def __missing__(self, codepoint: int) -> None:
+        self[codepoint] = None
+        return None
+
+
+_KEEP_ASCII_DIGITS = _AsciiDigitTable({c: c for c in range(ord("0"), ord("9") + 1)})
+
+# Region used to interpret numbers dialled without a +<country code> prefix.
+DEFAULT_PHONE_REGION = "IN"
+
+# Raw read buffer for CSV streaming; keeps I/O bounded on very large files.
+CSV_READ_BUFFER_BYTES = 64 * 1024
+
+
+def digits_only(value: str) -> str:
+    """Strip phone input down to its ASCII digits."""
+    return value.translate(_KEEP_ASCII_DIGITS)
+
+
+@functools.lru_cache(maxsize=1024)
+def to_e164(raw: str, region: str = DEFAULT_PHONE_REGION) -> str:
+    """
+    Validate a phone number against libphonenumber metadata and format it as E.164.
+    Raises ValueError for numbers that cannot be dialled.
+    """
+    try:
+        parsed = phonenumbers.parse(raw, region)
+    except phonenumbers.NumberParseException as e:
+        raise ValueError(f"Unparseable phone number {raw!r}: {e}") from e
+    if not phonenumbers.is_valid_number(parsed):
+        raise ValueError(f"Invalid phone number {raw!r} for region {region}")
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
+def iter_csv_rows(csv_path: str, max_rows: int) -> Iterator[list[str]]:
+    """
+    Stream the header plus at most `max_rows` non-blank rows from a CSV file.
+    Stops pulling bytes from disk once enough rows have been read.
+    """
+    with open(csv_path, mode="rb", buffering=CSV_READ_BUFFER_BYTES) as raw:
+        with io.TextIOWrapper(raw, encoding="utf-8-sig", newline="") as text:
+            yield from itertools.islice(filter(None, csv.reader(text)), max_rows + 1)